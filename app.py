@@ -1,92 +1,74 @@
 import streamlit as st
+import csv
+import io
 import os
+import shutil
+import tempfile
 import pandas as pd
 import zipfile
-from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from urllib.parse import quote
 
 #Comment to update 
 
-import subprocess
-try:
-    subprocess.run(["libreoffice", "--version"], check=True)
-    print("✅ LibreOffice is installed!")
-except:
-    print("❌ LibreOffice is missing!")
-
     
 # Import your processing functions and constants
 from functions import (
-    generate_cover_pdf,
-    parse_via_pdf,
-    fill_template,
+    render_cover_docx,
+    render_sweet_spot_docx,
+    render_conflict_docx_for_one,
+    convert_docx_batch_to_pdf,
+    parse_via_bytes,
     fill_conflict_docs,
-    fill_conflict_docs_for_one,
-    merge_custom_pages_by_index,
-    paginate_pdf,
-    is_name_match,
-    process_via_survey,
-    STRENGTH_DATA
+    load_conflict_responses,
+    init_batch_worker,
+    build_workbook_pdf,
+    match_participants,
+    render_via_survey,
+    process_one,
+    workbook_paths,
+    STRENGTH_DATA,
+    libreoffice_available
 )
-
-def normalize_spaces(s: str) -> str:
-    return " ".join(s.split())
-
-def split_first_last(person_name: str):
+from name_utils import split_first_last, strengths_to_row
+
+@st.cache_resource
+def _check_libreoffice():
+    """Check whether the converters will use LibreOffice, once per server process."""
+    return libreoffice_available()
+
+if _check_libreoffice():
+    st.sidebar.caption("✅ LibreOffice found: converting DOCX to PDF locally.")
+else:
+    st.sidebar.caption("❌ LibreOffice not used: converting DOCX to PDF through Google Drive.")
+
+def save_upload(upload, path):
+    """Stream an uploaded file to disk in 1 MB chunks instead of reading it into one bytes object."""
+    upload.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(upload, f, length=1024 * 1024)
+    upload.seek(0)
+
+def write_zip(file_paths):
     """
-    Split a full name into (first_name, last_name) for spreadsheet export.
+    Write the given files into a new, uniquely named ZIP in OUTPUT_FOLDER and return its path,
+    so concurrent sessions never overwrite or read each other's archive. The caller removes
+    it once it has been handed to st.download_button.
 
-    Heuristics:
-    - Handles 'Last, First Middle' -> ('First', 'Last')
-    - Handles suffixes (e.g., Jr., Sr., II, III) by dropping them from the tail
-    - If no last name present, last_name = '' (keeps it safe for spreadsheets)
+    The entries are PDFs whose streams are already deflate-compressed, so they are
+    stored as-is rather than compressed a second time.
     """
-    if not person_name:
-        return "", ""
-
-    name = normalize_spaces(person_name)
-
-    # Remove 'VIA' artifacts just in case (defensive; parse_via_pdf already strips)
-    name = name.replace("VIA Character Strengths Profile", "").strip()
-
-    # Common suffixes to ignore at the end
-    suffixes = {"Jr", "Jr.", "Sr", "Sr.", "II", "III", "IV", "V"}
-
-    if "," in name:
-        # Format: "Last, First Middle ..."
-        last, first_part = [normalize_spaces(x) for x in name.split(",", 1)]
-        first_tokens = first_part.split()
-        if first_tokens and first_tokens[-1] in suffixes:
-            first_tokens = first_tokens[:-1]
-        first = first_tokens[0] if first_tokens else ""
-        last_tokens = last.split()
-        if last_tokens and last_tokens[-1] in suffixes:
-            last_tokens = last_tokens[:-1]
-        last = " ".join(last_tokens)
-        return first, last
-
-    # Format: "First Middle Last [Suffix]"
-    tokens = name.split()
-    if tokens and tokens[-1] in suffixes:
-        tokens = tokens[:-1]
-
-    if len(tokens) == 1:
-        return tokens[0], ""
-    else:
-        # First token is first name, everything after the first token collapsed into last name
-        first = tokens[0]
-        last = " ".join(tokens[1:])
-        return first, last
-
-def strengths_to_row(results, top_n=24):
-    """Convert parse_via_pdf results -> list of strength names ordered by rank, clipped/padded to top_n."""
-    strengths = [s for (_, s) in sorted(results, key=lambda x: x[0])]
-    strengths = strengths[:top_n]
-    if len(strengths) < top_n:
-        strengths += [""] * (top_n - len(strengths))
-    return strengths
-
+    fd, zip_path = tempfile.mkstemp(dir=OUTPUT_FOLDER, suffix=".zip")
+    with os.fdopen(fd, "wb") as zip_fh, zipfile.ZipFile(zip_fh, "w", zipfile.ZIP_STORED) as zip_file:
+        for file_path in file_paths:
+            if os.path.exists(file_path):
+                zip_file.write(file_path, arcname=os.path.basename(file_path))
+    return zip_path
 
+@st.cache_data(show_spinner=False)
+def parse_via_cached(pdf_bytes: bytes):
+    """parse_via_pdf keyed on the uploaded file's content, so reruns and repeat uploads skip parsing."""
+    return parse_via_bytes(pdf_bytes)
 
 
 # Define resource paths
@@ -102,6 +84,11 @@ NAIS_TEMPLATE_DOCX  = os.path.join("resources", "NAISTemplate.docx")
 OUTPUT_FOLDER = "output"
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)  # No error if it already exists
 
+# Scratch space for intermediate files: RAM-backed /dev/shm when it has room, else the system temp dir
+WORK_DIR_ROOT = None
+if os.path.isdir("/dev/shm") and shutil.disk_usage("/dev/shm").free >= 1024 ** 3:
+    WORK_DIR_ROOT = "/dev/shm"
+
 st.title("Automated Workbook Creator")
 
 # Sidebar: choose mode and template
@@ -137,43 +124,47 @@ if mode == "Individual":
     
     if st.button("Generate Workbook"):
         if participant_name and term and cohort and via_file is not None and conflict_csv is not None:
-            # Save the uploaded files to disk
-            via_filepath = os.path.join(OUTPUT_FOLDER, f"{participant_name}_via.pdf")
-            conflict_csv_path = os.path.join(OUTPUT_FOLDER, f"{participant_name}_conflict.csv")
-            with open(via_filepath, "wb") as f:
-                f.write(via_file.read())
-            with open(conflict_csv_path, "wb") as f:
-                f.write(conflict_csv.read())
+            # Intermediate files live in a throwaway work dir; only the workbook is kept
+            with tempfile.TemporaryDirectory(dir=WORK_DIR_ROOT) as work_dir:
+                # Save the uploaded files to disk
+                via_filepath = os.path.join(work_dir, f"{participant_name}_via.pdf")
+                conflict_csv_path = os.path.join(work_dir, f"{participant_name}_conflict.csv")
+                save_upload(via_file, via_filepath)
+                save_upload(conflict_csv, conflict_csv_path)
             
-            # 1. Generate Cover Page
-            cover_pdf = cover_pdf = generate_cover_pdf(participant_name,term,cohort,OUTPUT_FOLDER,lab_type=lab_type)
+                # 1. Fill Cover Page
+                cover_docx = render_cover_docx(participant_name,term,cohort,work_dir,lab_type=lab_type)
 
         
-            # 2. Parse VIA Survey
-            parsed_name, results = parse_via_pdf(via_filepath)
-            final_name = participant_name  # or use parsed_name if needed
+                # 2. Parse VIA Survey
+                parsed_name, results = parse_via_cached(via_file.getvalue())
+                final_name = participant_name  # or use parsed_name if needed
             
-            # 3. Fill Sweet Spot Template
-            sweet_output_docx = os.path.join(OUTPUT_FOLDER, f"{final_name}_SweetSpot.docx")
-            sweet_pdf = fill_template(results, STRENGTH_DATA, final_name, SWEET_SPOT_TEMPLATE_DOCX, sweet_output_docx)
+                paths = workbook_paths(final_name, OUTPUT_FOLDER, work_dir)
             
-            # 4. Process Conflict Resolution
-            conflict_pdf = fill_conflict_docs_for_one(conflict_csv_path, CONFLICT_TEMPLATE_DOCX, OUTPUT_FOLDER, final_name)
+                # 3. Fill Sweet Spot Template
+                sweet_docx = render_sweet_spot_docx(results, STRENGTH_DATA, final_name, SWEET_SPOT_TEMPLATE_DOCX, paths["sweet"])
             
-            # 5. Merge PDFs using the selected template
-            merged_pdf = os.path.join(OUTPUT_FOLDER, f"{final_name.replace(' ', '_')}_merged.pdf")
-            merge_custom_pages_by_index(
-                template_pdf=template_pdf,
-                cover_pdf=cover_pdf,
-                via_pdf=via_filepath,
-                sweet_pdf=sweet_pdf,
-                conflict_pdf=conflict_pdf,
-                output_pdf=merged_pdf
-            )
+                # 4. Process Conflict Resolution
+                conflict_docx = render_conflict_docx_for_one(conflict_csv_path, CONFLICT_TEMPLATE_DOCX, work_dir, final_name)
+
+                # Convert all filled DOCX files to PDF in one pass
+                pdf_paths = convert_docx_batch_to_pdf([p for p in (cover_docx, sweet_docx, conflict_docx) if p])
+                cover_pdf, sweet_pdf = pdf_paths[:2]
+                conflict_pdf = pdf_paths[2] if conflict_docx else None
             
-            # 6. Paginate the Merged PDF
-            final_workbook_pdf = os.path.join(OUTPUT_FOLDER, f"{final_name.replace(' ', '_')}_workbook.pdf")
-            paginate_pdf(merged_pdf, final_workbook_pdf, start_page_index=3, start_page_number=3)
+                # 5. Merge and paginate the PDFs using the selected template
+                final_workbook_pdf = paths["final"]
+                build_workbook_pdf(
+                    template_pdf=template_pdf,
+                    cover_pdf=cover_pdf,
+                    via_pdf=via_filepath,
+                    sweet_pdf=sweet_pdf,
+                    conflict_pdf=conflict_pdf,
+                    output_pdf=final_workbook_pdf,
+                    start_page_index=3,
+                    start_page_number=3
+                )
             
             st.success(f"Workbook for {participant_name} generated successfully!")
             
@@ -196,84 +187,62 @@ elif mode == "Batch":
     
     if st.button("Generate Batch Workbooks"):
         if term and cohort and via_files and conflict_csv_batch is not None:
-            # Save the conflict CSV file
-            conflict_csv_path = os.path.join(OUTPUT_FOLDER, "batch_conflict.csv")
-            with open(conflict_csv_path, "wb") as f:
-                f.write(conflict_csv_batch.read())
+            # Intermediate files live in a throwaway work dir; only the workbooks are kept
+            with tempfile.TemporaryDirectory(dir=WORK_DIR_ROOT) as work_dir:
+                # Save the conflict CSV file
+                conflict_csv_path = os.path.join(work_dir, "batch_conflict.csv")
+                save_upload(conflict_csv_batch, conflict_csv_path)
             
-            # Parse the CSV for participant names
-            df = pd.read_csv(conflict_csv_path)
-            csv_names = set(df["First and Last Name"].str.strip().dropna().unique())
-            
-            # Save VIA PDFs and parse names from each
-            pdf_names = {}
-            for via_file in via_files:
-                via_filepath = os.path.join(OUTPUT_FOLDER, via_file.name)
-                with open(via_filepath, "wb") as f:
-                    f.write(via_file.read())
-                participant_name, _ = parse_via_pdf(via_filepath)
-                pdf_names[via_file.name] = participant_name
+                # Parse the CSV once; the workers reuse it for every participant
+                conflict_df = load_conflict_responses(conflict_csv_path)
+                csv_names = set(conflict_df["First and Last Name"].str.strip().unique())
             
-            # Matching logic
-            matched_pairs = []
-            missing_pdf = []
-            missing_csv = []
-            name_mismatches = []
+                # Save VIA PDFs and parse each once; the results are reused for the workbooks
+                pdf_names = {}
+                via_results = {}
+                for via_file in via_files:
+                    via_filepath = os.path.join(work_dir, via_file.name)
+                    save_upload(via_file, via_filepath)
+                    participant_name, results = parse_via_cached(via_file.getvalue())
+                    pdf_names[via_file.name] = participant_name
+                    via_results[via_file.name] = results
             
-            for csv_name in csv_names:
-                matched = False
-                for pdf_filename, pdf_name in pdf_names.items():
-                    if is_name_match(csv_name, pdf_name):
-                        matched_pairs.append((csv_name, pdf_name, pdf_filename))
-                        matched = True
-                        break
-                if not matched:
-                    missing_pdf.append(csv_name)
+                # Matching logic
+                matched_pairs, missing_pdf, missing_csv = match_participants(csv_names, pdf_names)
+                name_mismatches = []
+
+                # Submit the largest VIA PDFs first so workers finish at roughly the same time
+                sizes = {pdf_filename: os.path.getsize(os.path.join(work_dir, pdf_filename))
+                         for _, _, pdf_filename in matched_pairs}
+                matched_pairs.sort(key=lambda pair: -sizes[pair[2]])
             
-            for pdf_filename, pdf_name in pdf_names.items():
-                matched = False
-                for csv_name in csv_names:
-                    if is_name_match(csv_name, pdf_name):
-                        matched = True
-                        break
-                if not matched:
-                    missing_csv.append(pdf_name)
-            
-            generated_files = []
-            # Process each matched pair to generate workbooks
-            for csv_name, pdf_name, pdf_filename in matched_pairs:
-                via_filepath = os.path.join(OUTPUT_FOLDER, pdf_filename)
-                conflict_pdf = fill_conflict_docs_for_one(conflict_csv_path, CONFLICT_TEMPLATE_DOCX, OUTPUT_FOLDER, csv_name)
-                if not conflict_pdf:
-                    name_mismatches.append((csv_name, pdf_name))
-                    continue
-                
-                # Generate cover page
-                cover_pdf = generate_cover_pdf(csv_name,term,cohort,OUTPUT_FOLDER,lab_type=lab_type)
-                
-                # Parse VIA PDF
-                parsed_name, results = parse_via_pdf(via_filepath)
-                
-                # Fill Sweet Spot Template
-                sweet_output_docx = os.path.join(OUTPUT_FOLDER, f"{csv_name.replace(' ', '_')}_SweetSpot.docx")
-                sweet_pdf = fill_template(results, STRENGTH_DATA, csv_name, SWEET_SPOT_TEMPLATE_DOCX, sweet_output_docx)
-                
-                # Merge PDFs
-                merged_pdf = os.path.join(OUTPUT_FOLDER, f"{csv_name.replace(' ', '_')}_merged.pdf")
-                merge_custom_pages_by_index(
-                    template_pdf=template_pdf,
-                    cover_pdf=cover_pdf,
-                    via_pdf=via_filepath,
-                    sweet_pdf=sweet_pdf,
-                    conflict_pdf=conflict_pdf,
-                    output_pdf=merged_pdf
-                )
-                
-                # Paginate the merged PDF
-                final_workbook_pdf = os.path.join(OUTPUT_FOLDER, f"{csv_name.replace(' ', '_')}_workbook.pdf")
-                paginate_pdf(merged_pdf, final_workbook_pdf, start_page_index=3, start_page_number=3)
-                
-                generated_files.append(final_workbook_pdf)
+                generated_files = []
+                failed = []
+                # Process matched pairs in parallel; each participant's workbook is independent.
+                # No workers are started when nothing matched, and never more than there are pairs.
+                if matched_pairs:
+                    progress = st.progress(0.0)
+                    with ProcessPoolExecutor(
+                        max_workers=min(os.cpu_count() or 1, len(matched_pairs)),
+                        initializer=init_batch_worker,
+                        initargs=(conflict_df, template_pdf),
+                    ) as executor:
+                        futures = {}
+                        for csv_name, pdf_name, pdf_filename in matched_pairs:
+                            via_filepath = os.path.join(work_dir, pdf_filename)
+                            job = (csv_name, via_filepath, via_results[pdf_filename], conflict_csv_path, term, cohort, lab_type,
+                                   template_pdf, SWEET_SPOT_TEMPLATE_DOCX, CONFLICT_TEMPLATE_DOCX, work_dir, OUTPUT_FOLDER)
+                            futures[executor.submit(process_one, job)] = pdf_name
+
+                        for done, future in enumerate(as_completed(futures), start=1):
+                            csv_name, final_workbook_pdf, err = future.result()
+                            if err:
+                                failed.append((csv_name, err))
+                            elif final_workbook_pdf is None:
+                                name_mismatches.append((csv_name, futures[future]))
+                            else:
+                                generated_files.append(final_workbook_pdf)
+                            progress.progress(done / len(futures))
             
             st.success("Batch processing complete!")
             st.subheader("Report Summary")
@@ -293,16 +262,17 @@ elif mode == "Batch":
                 st.markdown("**Name Mismatches:**")
                 for csv_name, pdf_name in name_mismatches:
                     st.markdown(f"- {csv_name} (CSV) vs. {pdf_name} (PDF)")
+            if failed:
+                st.markdown("**Failed to Generate:**")
+                for csv_name, err in failed:
+                    st.markdown(f"- {csv_name}: {err}")
             
-            # Create a ZIP archive in memory with all generated workbooks
-            zip_buffer = BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                for file_path in generated_files:
-                    if os.path.exists(file_path):
-                        zip_file.write(file_path, arcname=os.path.basename(file_path))
-            zip_buffer.seek(0)
-            
-            st.download_button("Download All Workbooks as ZIP", zip_buffer.getvalue(), file_name="workbooks.zip", mime="application/zip")
+            # Create a ZIP archive on disk with all generated workbooks
+            zip_path = write_zip(generated_files)
+            with open(zip_path, "rb") as f:
+                st.download_button("Download All Workbooks as ZIP", data=f, file_name="workbooks.zip", mime="application/zip")
+            # download_button has read the archive into the session's response already
+            os.remove(zip_path)
         else:
             st.error("Please provide all required inputs and files for batch processing.")
 
@@ -320,36 +290,34 @@ elif mode == "VIA → Spreadsheet":
             failed = []
 
             for f in via_files:
-                # Save temporarily (parse_via_pdf expects a path)
-                tmp_path = os.path.join(OUTPUT_FOLDER, f.name)
-                with open(tmp_path, "wb") as out:
-                    out.write(f.read())
-
                 try:
-                    person_name, results = parse_via_pdf(tmp_path)
+                    person_name, results = parse_via_cached(f.getvalue())
                     first, last = split_first_last(person_name)
                     strengths = strengths_to_row(results, top_n=24)  # always 24
                     rows.append([first, last] + strengths)
                 except Exception as e:
                     failed.append((f.name, str(e)))
 
-            # Build DataFrame (with headers for display / download)
+            # Build DataFrame (with headers, only for on-screen display)
             columns = ["First Name", "Last Name"] + [f"Strength {i}" for i in range(1, 25)]
             df = pd.DataFrame(rows, columns=columns)
 
             st.success("Extraction complete.")
             st.dataframe(df, use_container_width=True)
 
-            # ✅ Copy-paste block (NO headers, tab-delimited)
-            tsv_text_no_header = df.to_csv(index=False, sep="\t", header=False)
+            # ✅ Copy-paste block (NO headers, tab-delimited), joined straight from the rows
+            tsv_text_no_header = "\n".join("\t".join(row) for row in rows)
             st.markdown("**Copy-Paste (Google Sheets Ready — no headers):**")
             st.code(tsv_text_no_header, language="text")
 
             # ✅ Download CSV (keeps headers for safer record-keeping)
-            csv_text = df.to_csv(index=False)
+            csv_buffer = io.StringIO()
+            writer = csv.writer(csv_buffer, lineterminator="\n")
+            writer.writerow(columns)
+            writer.writerows(rows)
             st.download_button(
                 "Download as CSV (with headers)",
-                data=csv_text.encode("utf-8"),
+                data=csv_buffer.getvalue().encode("utf-8"),
                 file_name="via_strengths_export.csv",
                 mime="text/csv",
             )
@@ -378,27 +346,43 @@ elif mode == "VIA → Sweet Spot":
         else:
             generated_files = []
             failed = []
+            rendered = []  # (upload name, Sweet Spot DOCX path)
 
             for via_file in via_files:
                 try:
                     # Save uploaded PDF temporarily
                     via_filepath = os.path.join(OUTPUT_FOLDER, via_file.name)
-                    with open(via_filepath, "wb") as f:
-                        f.write(via_file.read())
+                    save_upload(via_file, via_filepath)
 
-                    # Use existing helper from functions.py
-                    sweet_pdf = process_via_survey(
+                    # Fill the Sweet Spot DOCX now; every sheet is converted together below
+                    sweet_docx = render_via_survey(
                         pdf_path=via_filepath,
                         strength_data=STRENGTH_DATA,
                         template_path=SWEET_SPOT_TEMPLATE_DOCX,
                         output_folder=OUTPUT_FOLDER
                     )
-
-                    generated_files.append(sweet_pdf)
+                    rendered.append((via_file.name, sweet_docx))
 
                 except Exception as e:
                     failed.append((via_file.name, str(e)))
 
+            if rendered:
+                # Clear PDFs left by an earlier run so the check below only sees new ones
+                for _, docx in rendered:
+                    stale_pdf = os.path.splitext(docx)[0] + ".pdf"
+                    if os.path.exists(stale_pdf):
+                        os.remove(stale_pdf)
+                try:
+                    generated_files = convert_docx_batch_to_pdf([docx for _, docx in rendered])
+                except Exception as e:
+                    # Keep whichever sheets were converted before the failure
+                    for fname, docx in rendered:
+                        pdf_path = os.path.splitext(docx)[0] + ".pdf"
+                        if os.path.exists(pdf_path):
+                            generated_files.append(pdf_path)
+                        else:
+                            failed.append((fname, str(e)))
+
             if generated_files:
                 st.success(f"Generated {len(generated_files)} Sweet Spot sheet(s).")
 
@@ -414,19 +398,15 @@ elif mode == "VIA → Sweet Spot":
                         )
                 else:
                     # If multiple, zip them
-                    zip_buffer = BytesIO()
-                    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                        for file_path in generated_files:
-                            if os.path.exists(file_path):
-                                zip_file.write(file_path, arcname=os.path.basename(file_path))
-                    zip_buffer.seek(0)
-
-                    st.download_button(
-                        "Download All Sweet Spot PDFs as ZIP",
-                        zip_buffer.getvalue(),
-                        file_name="sweet_spot_sheets.zip",
-                        mime="application/zip",
-                    )
+                    zip_path = write_zip(generated_files)
+                    with open(zip_path, "rb") as f:
+                        st.download_button(
+                            "Download All Sweet Spot PDFs as ZIP",
+                            data=f,
+                            file_name="sweet_spot_sheets.zip",
+                            mime="application/zip",
+                        )
+                    os.remove(zip_path)
 
             if failed:
                 st.warning("Some files could not be processed:")
@@ -451,8 +431,7 @@ elif mode == "Conflict Report → Conflict Style":
             try:
                 # Save uploaded CSV
                 conflict_csv_path = os.path.join(OUTPUT_FOLDER, conflict_csv.name)
-                with open(conflict_csv_path, "wb") as f:
-                    f.write(conflict_csv.read())
+                save_upload(conflict_csv, conflict_csv_path)
 
                 # Generate all conflict style PDFs
                 participant_names = fill_conflict_docs(
@@ -483,18 +462,15 @@ elif mode == "Conflict Report → Conflict Style":
                 else:
                     st.success(f"Generated {len(generated_files)} conflict style sheets.")
 
-                    zip_buffer = BytesIO()
-                    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                        for file_path in generated_files:
-                            zip_file.write(file_path, arcname=os.path.basename(file_path))
-                    zip_buffer.seek(0)
-
-                    st.download_button(
-                        "Download All Conflict Style PDFs as ZIP",
-                        zip_buffer.getvalue(),
-                        file_name="conflict_style_sheets.zip",
-                        mime="application/zip",
-                    )
+                    zip_path = write_zip(generated_files)
+                    with open(zip_path, "rb") as f:
+                        st.download_button(
+                            "Download All Conflict Style PDFs as ZIP",
+                            data=f,
+                            file_name="conflict_style_sheets.zip",
+                            mime="application/zip",
+                        )
+                    os.remove(zip_path)
 
                     st.markdown("**Generated for:**")
                     for name in participant_names:
@@ -1,32 +1,33 @@
-import re
-from pypdf import PdfReader
-import os
-import subprocess
-from docxtpl import DocxTemplate
-import pandas as pd
-from fuzzywuzzy import fuzz
-import streamlit as st
-
-
-import os
-import subprocess
-import pypandoc
-
-import os
-import subprocess
-
+import contextlib
+import functools
+import io
+import logging
 import os
-import subprocess
+import pathlib
+import queue
+import re
 import shutil
-import pypandoc
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-import os
-import io
+import fitz  # PyMuPDF
+import httplib2
+import pandas as pd
 import streamlit as st
+from docxtpl import DocxTemplate
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+from name_utils import normalize_key
+
+logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
 def get_credentials():
     # Load credentials from Streamlit secrets
     credentials_dict = st.secrets["google_service_account"]
@@ -36,70 +37,403 @@ def get_credentials():
     )
     return creds
 
-def convert_docx_to_pdf_gdrive(docx_path, output_pdf_path):
+
+@functools.lru_cache(maxsize=1)
+def _drive_service():
     """
-    Converts a DOCX file to PDF using the Google Drive API by first converting
-    the DOCX file into a native Google Docs file (which can then be exported).
-    
-    Parameters:
-      docx_path (str): Local path to the input DOCX file.
-      output_pdf_path (str): Local path where the output PDF will be saved.
-    
-    Returns:
-      str: The path to the converted PDF file.
+    Returns the Drive API client shared by all conversions, built once per process.
+    static_discovery loads the Drive discovery document bundled with google-api-python-client
+    instead of fetching it over HTTPS.
     """
-    # Load credentials using st.secrets
-    creds = get_credentials()
-    
-    # Build the Drive API client
-    service = build('drive', 'v3', credentials=creds)
-    
-    # Upload the DOCX file and force conversion to a Google Docs file
+    return build('drive', 'v3', credentials=get_credentials(), cache_discovery=False, static_discovery=True)
+
+DOCX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+# Concurrent Drive conversions per batch; Drive allows roughly 10 writes/s per user
+DRIVE_MAX_WORKERS = 8
+
+# Drive accepts at most 100 calls in one batch request
+DRIVE_BATCH_LIMIT = 100
+
+# Large enough that a rendered PDF comes back in a single response (the default is 100 KB)
+DRIVE_DOWNLOAD_CHUNKSIZE = 16 * 1024 * 1024
+
+# Idle authorized HTTP clients, kept across batches so their keep-alive connections to Drive
+# (and TLS sessions) are reused instead of re-established for every batch
+_idle_http = queue.LifoQueue(maxsize=DRIVE_MAX_WORKERS)
+
+
+def _reset_drive_clients():
+    """
+    Drops the pooled HTTP clients and the cached Drive service in a forked child (e.g. a
+    ProcessPoolExecutor worker). They hold the parent's open sockets, which the child must
+    not write to; the child builds its own on first use.
+    """
+    global _idle_http
+    _idle_http = queue.LifoQueue(maxsize=DRIVE_MAX_WORKERS)
+    _drive_service.cache_clear()
+
+
+os.register_at_fork(after_in_child=_reset_drive_clients)
+
+
+@contextlib.contextmanager
+def _borrow_http(creds):
+    """
+    Lends an authorized HTTP client for exclusive use by the calling thread. httplib2 clients
+    are not thread-safe, so concurrent Drive requests must not share one; each borrower gets
+    an idle client (most recently used first, so its connection is likely still open) or a
+    new one, and returns it afterwards.
+    """
+    try:
+        http = _idle_http.get_nowait()
+    except queue.Empty:
+        http = AuthorizedHttp(creds, http=httplib2.Http())
+    try:
+        yield http
+    finally:
+        try:
+            _idle_http.put_nowait(http)
+        except queue.Full:
+            pass
+
+
+def _upload_docx_as_gdoc(service, docx_path, http=None, name=None):
+    """
+    Uploads a DOCX to Drive, converting it to a native Google Docs file. Returns its ID.
+
+    docx_path may also be a binary file object (e.g. a BytesIO holding a rendered DOCX),
+    which is uploaded straight from memory under `name`.
+    """
+    if isinstance(docx_path, (str, os.PathLike)):
+        name = name or os.path.basename(docx_path)
+        # resumable=False sends the whole file in one multipart request; a resumable upload
+        # would first open a session, adding a round trip for files this small
+        media = MediaFileUpload(docx_path, mimetype=DOCX_MIMETYPE, resumable=False)
+    else:
+        docx_path.seek(0)
+        media = MediaIoBaseUpload(docx_path, mimetype=DOCX_MIMETYPE, resumable=False)
     file_metadata = {
-        'name': os.path.basename(docx_path),
+        'name': name,
         # This MIME type instructs Drive to convert the file to a native Docs format.
         'mimeType': 'application/vnd.google-apps.document'
     }
-    media = MediaFileUpload(
-        docx_path,
-        mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-    )
     file = service.files().create(
         body=file_metadata, 
         media_body=media, 
         fields='id'
-    ).execute()
-    file_id = file.get('id')
-    st.write(f"Uploaded file ID: {file_id}")
-    
-    # Export the newly created Google Docs file as a PDF
+    ).execute(http=http)
+    return file.get('id')
+
+
+def _export_gdoc_pdf(service, file_id, output_pdf_path, http=None):
+    """Downloads a Google Docs file as a PDF to output_pdf_path."""
     request = service.files().export_media(
         fileId=file_id,
         mimeType='application/pdf'
     )
+    if http is not None:
+        request.http = http
     with io.FileIO(output_pdf_path, 'wb') as fh:
-        downloader = MediaIoBaseDownload(fh, request)
+        downloader = MediaIoBaseDownload(fh, request, chunksize=DRIVE_DOWNLOAD_CHUNKSIZE)
         done = False
         while not done:
-            status, done = downloader.next_chunk()
-            if status:
-                st.write(f"Download {int(status.progress() * 100)}%.")
+            _, done = downloader.next_chunk()
+
+
+def _delete_drive_files(service, file_ids):
+    """Deletes Drive files using batch requests, one HTTP round trip per DRIVE_BATCH_LIMIT files."""
+    for start in range(0, len(file_ids), DRIVE_BATCH_LIMIT):
+        batch = service.new_batch_http_request()
+        for file_id in file_ids[start:start + DRIVE_BATCH_LIMIT]:
+            batch.add(service.files().delete(fileId=file_id))
+        with _borrow_http(get_credentials()) as http:
+            batch.execute(http=http)
+
+
+def convert_docx_to_pdf_gdrive(docx_path, output_pdf_path):
+    """
+    Converts a DOCX file to PDF using the Google Drive API by first converting
+    the DOCX file into a native Google Docs file (which can then be exported).
     
-    st.write(f"Converted PDF saved as: {output_pdf_path}")
+    Parameters:
+      docx_path (str or file object): Local path to the input DOCX file, or a binary
+        file object (e.g. BytesIO) holding it, which is uploaded without touching disk.
+      output_pdf_path (str): Local path where the output PDF will be saved.
     
-    # Optionally, delete the file from Drive to clean up
-    service.files().delete(fileId=file_id).execute()
-    st.write("Temporary file deleted from Google Drive.")
+    Returns:
+      str: The path to the converted PDF file.
+    """
+    # Drive API client, built once from the credentials in st.secrets
+    service = _drive_service()
+    
+    # Upload the DOCX file and force conversion to a Google Docs file
+    docx_name = os.path.splitext(os.path.basename(output_pdf_path))[0] + ".docx"
+    # The service's own HTTP client is shared by every session; borrow one for this call
+    with _borrow_http(get_credentials()) as http:
+        file_id = _upload_docx_as_gdoc(service, docx_path, http=http, name=docx_name)
+        logger.debug("Uploaded file ID: %s", file_id)
+
+        # Export the newly created Google Docs file as a PDF
+        _export_gdoc_pdf(service, file_id, output_pdf_path, http=http)
+
+        logger.debug("Converted PDF saved as: %s", output_pdf_path)
+
+        # Delete the temporary Google Docs copy right away; it holds participant data
+        service.files().delete(fileId=file_id).execute(http=http)
+        logger.debug("Temporary file deleted from Google Drive.")
     
     return output_pdf_path
 
 
+def convert_docx_batch_to_pdf_gdrive(docx_paths):
+    """
+    Converts many DOCX files to PDFs (same name, .pdf extension) through Google Drive.
+
+    Uploads and exports run concurrently on DRIVE_MAX_WORKERS threads, each on its own
+    pooled HTTP client (see _borrow_http), since every conversion is bound by Drive round
+    trips. docx_paths may be a generator: each file is submitted as soon as it is produced,
+    so the caller can keep rendering while earlier files convert. The temporary Google Docs
+    files are then removed with batched delete requests, even if a conversion failed.
+    """
+    creds = get_credentials()
+    service = _drive_service()
+    uploaded_ids = []
+
+    def convert(docx_path):
+        pdf_path = os.path.splitext(docx_path)[0] + ".pdf"
+        with _borrow_http(creds) as http:
+            file_id = _upload_docx_as_gdoc(service, docx_path, http=http)
+            uploaded_ids.append(file_id)
+            _export_gdoc_pdf(service, file_id, pdf_path, http=http)
+        logger.debug("Converted PDF saved as: %s", pdf_path)
+        return pdf_path
+
+    try:
+        with ThreadPoolExecutor(max_workers=DRIVE_MAX_WORKERS) as executor:
+            # map() submits each path as the iterable yields it
+            pdf_paths = list(executor.map(convert, docx_paths))
+    finally:
+        _delete_drive_files(service, uploaded_ids)
+    return pdf_paths
+
+
+# DOCX -> PDF conversion backend: "auto" uses LibreOffice when it is installed and Google Drive
+# otherwise; "gdrive" always goes through Drive (e.g. to match its rendering exactly)
+PDF_CONVERTER = os.environ.get("PDF_CONVERTER", "auto").lower()
+
+
+def _libreoffice_binary():
+    """Returns the LibreOffice executable to convert with, or None to use Google Drive."""
+    if PDF_CONVERTER == "gdrive":
+        return None
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def libreoffice_available():
+    """Returns True if DOCX files will be converted locally with LibreOffice, False for Google Drive."""
+    return _libreoffice_binary() is not None
+
+
+@contextlib.contextmanager
+def _libreoffice_profile():
+    """
+    Yields the URI of a fresh, private LibreOffice profile and deletes it afterwards.
+
+    A soffice started on a profile that is already in use hands its work to the running
+    instance (or silently does nothing), so every invocation gets its own profile. Several
+    sessions, threads or pool workers can then convert at the same time.
+    """
+    profile_dir = tempfile.mkdtemp(prefix="lo_profile_")
+    try:
+        yield pathlib.Path(profile_dir).as_uri()
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def convert_docx_to_pdf_local(docx_path, output_pdf_path):
+    """
+    Converts a DOCX file to PDF with a local headless LibreOffice, without any network I/O.
+
+    Parameters:
+      docx_path (str): Local path to the input DOCX file.
+      output_pdf_path (str): Local path where the output PDF will be saved.
+
+    Returns:
+      str: The path to the converted PDF file.
+    """
+    outdir = os.path.dirname(output_pdf_path) or "."
+    with _libreoffice_profile() as profile:
+        subprocess.run(
+            [_libreoffice_binary(), f"-env:UserInstallation={profile}", "--headless",
+             "--convert-to", "pdf", "--outdir", outdir, docx_path],
+            check=True,
+            capture_output=True
+        )
+    # LibreOffice names the PDF after the DOCX; move it if the caller asked for another name
+    converted = os.path.join(outdir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
+    if not os.path.exists(converted):
+        raise RuntimeError(f"LibreOffice did not produce: {converted}")
+    if os.path.abspath(converted) != os.path.abspath(output_pdf_path):
+        os.replace(converted, output_pdf_path)
+    return output_pdf_path
+
+
+def convert_docx_to_pdf(docx_path, output_pdf_path):
+    """
+    Converts a DOCX file to PDF locally with LibreOffice when it is installed, falling back to
+    the Google Drive round trip (convert_docx_to_pdf_gdrive) otherwise.
+
+    This backs the single-document helpers (generate_cover_pdf, fill_template,
+    fill_conflict_docs_for_one, process_via_survey), which stay as public API for scripts
+    using functions.py directly. The app itself renders DOCX files and converts them with
+    convert_docx_batch_to_pdf.
+    """
+    if _libreoffice_binary() is None:
+        return convert_docx_to_pdf_gdrive(docx_path, output_pdf_path)
+    return convert_docx_to_pdf_local(docx_path, output_pdf_path)
+
+
+def convert_docx_batch_to_pdf(docx_paths):
+    """
+    Converts several DOCX files to PDFs saved next to them (same name, .pdf extension).
+
+    When LibreOffice is installed, every file is converted by a single headless invocation,
+    so its start-up cost is paid once per batch instead of once per document. Each batch
+    uses its own temporary LibreOffice profile.
+    Without LibreOffice, the files go through convert_docx_batch_to_pdf_gdrive.
+
+    Parameters:
+      docx_paths (iterable): Local paths to the DOCX files. A generator is consumed lazily
+        on the Drive path, overlapping the caller's rendering with the uploads.
+
+    Returns:
+      list: The PDF paths, in the same order as docx_paths.
+    """
+    soffice = _libreoffice_binary()
+    if soffice is None:
+        return convert_docx_batch_to_pdf_gdrive(docx_paths)
+
+    docx_paths = list(docx_paths)
+    pdf_paths = [os.path.splitext(docx_path)[0] + ".pdf" for docx_path in docx_paths]
+
+    # --outdir takes a single directory, so group the files by where their PDFs belong
+    by_dir = {}
+    for docx_path in docx_paths:
+        by_dir.setdefault(os.path.dirname(docx_path) or ".", []).append(docx_path)
+
+    with _libreoffice_profile() as profile:
+        for outdir, paths in by_dir.items():
+            subprocess.run(
+                [soffice, f"-env:UserInstallation={profile}", "--headless",
+                 "--convert-to", "pdf", "--outdir", outdir, *paths],
+                check=True,
+                capture_output=True
+            )
+
+    missing = [pdf_path for pdf_path in pdf_paths if not os.path.exists(pdf_path)]
+    if missing:
+        raise RuntimeError(f"LibreOffice did not produce: {', '.join(missing)}")
+    logger.debug("Converted %d DOCX file(s) to PDF with LibreOffice", len(docx_paths))
+    return pdf_paths
+
+
+@functools.lru_cache(maxsize=None)
+def _read_template_bytes(template_path, mtime):
+    with open(template_path, "rb") as f:
+        return f.read()
+
+
+def load_docx_template(template_path):
+    """
+    Returns a fresh DocxTemplate for template_path. The file is read from disk once (and again
+    only if it changes), so rendering many documents from one template skips the repeated reads.
+    """
+    template_bytes = _read_template_bytes(template_path, os.path.getmtime(template_path))
+    return DocxTemplate(io.BytesIO(template_bytes))
+
+
+def normalize_name(name):
+    """
+    Normalizes a name for fuzzy comparison: lowercased, punctuation replaced by spaces
+    (rapidfuzz's default_process) and whitespace collapsed. Match loops should normalize
+    each name once and compare the normalized forms.
+    """
+    return " ".join(default_process(str(name)).split())
+
+
 def is_name_match(name1, name2, threshold=80):
     """
     Compare two names using fuzzy matching.
     Returns True if the similarity score is above the threshold.
+
+    Both names are compared in their normalize_name form; names that are equal after
+    normalizing match immediately, without computing a fuzzy score.
+    """
+    name1, name2 = normalize_name(name1), normalize_name(name2)
+    if name1 == name2:
+        return True
+    # With score_cutoff, rapidfuzz returns 0 for any score below the threshold
+    return fuzz.ratio(name1, name2, score_cutoff=threshold) > 0
+
+
+def match_participants(csv_names, pdf_names):
     """
-    return fuzz.ratio(name1, name2) >= threshold
+    Pairs participant names from the conflict CSV with the names parsed from VIA PDFs.
+
+    Names are first joined on normalize_key; only names left over after that are
+    fuzzy-matched (same rule as is_name_match), and only against PDFs that are still unmatched.
+
+    Parameters:
+      csv_names: Iterable of participant names from the CSV.
+      pdf_names: Dict mapping VIA PDF filename -> parsed participant name.
+
+    Returns:
+      tuple: (matched_pairs, missing_pdf, missing_csv), where matched_pairs is a list of
+             (csv_name, pdf_name, pdf_filename).
+    """
+    pdf_index = {}
+    for pdf_filename, pdf_name in pdf_names.items():
+        pdf_index.setdefault(normalize_key(pdf_name), (pdf_filename, pdf_name))
+
+    matched_pairs = []
+    missing_pdf = []
+    matched_keys = set()
+    fuzzy_candidates = []
+
+    for csv_name in csv_names:
+        key = normalize_key(csv_name)
+        if key in pdf_index:
+            pdf_filename, pdf_name = pdf_index[key]
+            matched_pairs.append((csv_name, pdf_name, pdf_filename))
+            matched_keys.add(key)
+        else:
+            fuzzy_candidates.append(csv_name)
+
+    if fuzzy_candidates:
+        # Score every leftover CSV name against every PDF name in one call; scores below
+        # the is_name_match threshold come back as 0
+        pdf_entries = list(pdf_index.items())
+        scores = process.cdist(
+            [normalize_name(csv_name) for csv_name in fuzzy_candidates],
+            [normalize_name(pdf_name) for _, (_, pdf_name) in pdf_entries],
+            scorer=fuzz.ratio,
+            score_cutoff=80,
+            workers=-1,
+        )
+        for csv_name, row in zip(fuzzy_candidates, scores):
+            # Take the first still-unmatched PDF that clears the threshold
+            for j in row.nonzero()[0]:
+                key, (pdf_filename, pdf_name) = pdf_entries[j]
+                if key not in matched_keys:
+                    matched_pairs.append((csv_name, pdf_name, pdf_filename))
+                    matched_keys.add(key)
+                    break
+            else:
+                missing_pdf.append(csv_name)
+
+    missing_csv = [pdf_name for key, (_, pdf_name) in pdf_index.items() if key not in matched_keys]
+    return matched_pairs, missing_pdf, missing_csv
 
 SCORE_MAP = {
     "Rarely": 1,
@@ -252,144 +586,243 @@ STRENGTH_DATA = {
     }
 }
 
+def _strength_lookup(strength_data):
+    """Maps lowercase strength name -> (underuse, optimal, overuse)."""
+    return {
+        name.lower(): (definitions["underuse"], definitions["optimal"], definitions["overuse"])
+        for name, definitions in strength_data.items()
+    }
 
-from pdfminer.high_level import extract_text
-import re
-import fitz  # PyMuPDF
-import re
 
-def parse_via_pdf(pdf_path):
-    print(f"Reading PDF using PyMuPDF from: {pdf_path}")
+# STRENGTH_DATA keyed by lowercase name, so lookups don't depend on how the PDF cased a strength
+STRENGTH_DATA_LC = _strength_lookup(STRENGTH_DATA)
 
-    doc = fitz.open(pdf_path)
-    full_text = ""
+# Placeholder names for each of the template's 24 Sweet Spot rows (1-indexed)
+SWEET_SPOT_FIELDS = tuple(
+    (f"strength{i}", f"underuse{i}", f"optimal{i}", f"overuse{i}") for i in range(1, 25)
+)
 
-    for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
-        text = page.get_text()
-        print(f"--- Page {page_num + 1} ---")
-        print(text)
-        full_text += text + "\n"
+# Blank (underuse, optimal, overuse) for unknown strengths and unused rows
+_NO_DEFINITIONS = ("", "", "")
 
-    doc.close()
+# Number of ranked strengths in a VIA Character Strengths Profile
+VIA_STRENGTH_COUNT = 24
+
+_NAME_RE = re.compile(r"^(.*?)\nVIA Character Strengths Profile", re.MULTILINE)
+_RANK_RE = re.compile(r"(\d+)\.\s+(.+)")
+_WS_RE = re.compile(r'\s+')
+
+def parse_via_pdf(pdf_path):
+    """
+    Extracts the participant name and ranked strengths from a VIA report.
 
-    print("\n=== Full Extracted Text ===")
-    print(full_text)
-    print("===========================\n")
+    pdf_path may be a file path or the raw PDF bytes.
+    """
+    if isinstance(pdf_path, (bytes, bytearray)):
+        logger.debug("Reading PDF using PyMuPDF from memory")
+        doc = fitz.open(stream=pdf_path, filetype="pdf")
+    else:
+        logger.debug("Reading PDF using PyMuPDF from: %s", pdf_path)
+        doc = fitz.open(pdf_path)
+    # The ranked list comes first in the report; stop extracting once all 24 ranks are in,
+    # rather than laying out the per-strength detail pages that follow
+    pages = []
+    rank_count = 0
+    for page in doc:
+        text = page.get_text("text")
+        pages.append(text)
+        rank_count += len(_RANK_RE.findall(text))
+        if rank_count >= VIA_STRENGTH_COUNT:
+            break
+    doc.close()
+    full_text = "\n".join(pages) + "\n"
 
     # Extract participant name
-    name_match = re.search(r"^(.*?)\nVIA Character Strengths Profile", full_text, re.MULTILINE)
-    name_match = re.search(r"^(.*?)\nVIA Character Strengths Profile", full_text, re.MULTILINE)
+    name_match = _NAME_RE.search(full_text)
     if name_match:
         person_name = name_match.group(1).strip()
         # Replace multiple whitespace characters with a single space
-        person_name = re.sub(r'\s+', ' ', person_name)
+        person_name = _WS_RE.sub(' ', person_name)
     else:
         person_name = "Catherine Soltys"
     # Extract strengths (e.g., "1. Humor")
-    pattern = re.compile(r"(\d+)\.\s+(.+)")
-    matches = pattern.findall(full_text)
+    matches = _RANK_RE.findall(full_text)
 
     results = [(int(rank), strength.strip()) for rank, strength in matches]
 
-    print(f"Extracted Name: {person_name}")
-    print("Extracted Strengths:")
-    for rank, strength in results:
-        print(f"{rank}: {strength}")
+    logger.debug("Extracted Name: %s", person_name)
+    logger.debug("Extracted Strengths: %s", results)
 
     return person_name, results
 
 
+def parse_via_bytes(pdf_bytes):
+    """
+    Same as parse_via_pdf, for a report held in memory (e.g. an upload's bytes), so it never
+    has to be written to disk. The app caches the results per upload with st.cache_data.
+    """
+    return parse_via_pdf(pdf_bytes)
 
 
-
-
-
-
-
-def fill_template(parsed_strengths, strength_data, person_name, template_path, output_docx_path):
+def render_sweet_spot_docx(parsed_strengths, strength_data, person_name, template_path, output_docx_path):
     """
-    Fills the Sweet Spot Template with the parsed strengths and their corresponding definitions,
-    then converts the filled DOCX to a PDF.
+    Fills the Sweet Spot Template with the parsed strengths and their corresponding definitions
+    and saves the DOCX, without converting it.
 
     Parameters:
       parsed_strengths: A list of tuples (rank, strength_name), sorted by rank.
-      strength_data: A dictionary mapping strength names (Title Case) to a dict with keys "underuse", "optimal", "overuse".
+      strength_data: A dictionary mapping strength names to a dict with keys "underuse", "optimal", "overuse".
+        Names are matched case-insensitively.
       person_name: The name of the individual (to fill the {{ name }} placeholder).
       template_path: Path to the template DOCX file.
-      output_docx_path: Path where the filled DOCX file will be saved.
+      output_docx_path: Path (or binary file object) where the filled DOCX file will be saved.
 
-    After saving the DOCX, the function converts it to PDF (by replacing the .docx extension with .pdf)
-    using the Google Drive conversion function.
+    Returns:
+      output_docx_path.
     """
     context = {}
     # Set the person's name in the template.
     context["name"] = person_name
 
-    # Loop through 24 positions (template expects 24 rows)
-    for i in range(24):
-        placeholder_index = i + 1  # placeholders are 1-indexed: strength1, underuse1, etc.
+    # Match strengths case-insensitively
+    if strength_data is STRENGTH_DATA:
+        strength_data_lc = STRENGTH_DATA_LC
+    else:
+        strength_data_lc = _strength_lookup(strength_data)
+
+    # Fill the template's 24 rows; positions beyond the parsed list stay blank
+    for i, (strength_key, underuse_key, optimal_key, overuse_key) in enumerate(SWEET_SPOT_FIELDS):
         if i < len(parsed_strengths):
-            # Get the strength name from parsed results
+            # Get the strength name from parsed results, shown in Title Case
             _, strength = parsed_strengths[i]
-            # Ensure the strength name is in Title Case to match the dictionary keys
-            strength_title = strength.title()
-            context[f"strength{placeholder_index}"] = strength_title
-            # Look up the definitions from the dictionary
-            if strength_title in strength_data:
-                context[f"underuse{placeholder_index}"] = strength_data[strength_title]["underuse"]
-                context[f"optimal{placeholder_index}"] = strength_data[strength_title]["optimal"]
-                context[f"overuse{placeholder_index}"] = strength_data[strength_title]["overuse"]
-            else:
-                # If the strength isn't found, leave the fields blank
-                context[f"underuse{placeholder_index}"] = ""
-                context[f"optimal{placeholder_index}"] = ""
-                context[f"overuse{placeholder_index}"] = ""
+            context[strength_key] = strength.title()
+            # Look up the definitions from the dictionary; leave them blank if it isn't found
+            definitions = strength_data_lc.get(strength.lower(), _NO_DEFINITIONS)
         else:
-            # For any positions beyond the parsed list, leave the placeholders blank
-            context[f"strength{placeholder_index}"] = ""
-            context[f"underuse{placeholder_index}"] = ""
-            context[f"optimal{placeholder_index}"] = ""
-            context[f"overuse{placeholder_index}"] = ""
+            context[strength_key] = ""
+            definitions = _NO_DEFINITIONS
+        context[underuse_key], context[optimal_key], context[overuse_key] = definitions
 
     # Load the template, render the context, and save the output DOCX.
-    doc = DocxTemplate(template_path)
+    doc = load_docx_template(template_path)
     doc.render(context)
     doc.save(output_docx_path)
-    print(f"Template has been filled and saved as: {output_docx_path}")
+    logger.debug("Template has been filled and saved as: %s", output_docx_path)
+    return output_docx_path
+
+
+def fill_template(parsed_strengths, strength_data, person_name, template_path, output_docx_path):
+    """
+    Fills the Sweet Spot Template (see render_sweet_spot_docx), then converts the filled DOCX
+    to a PDF.
 
+    After saving the DOCX, the function converts it to PDF (by replacing the .docx extension with .pdf)
+    with convert_docx_to_pdf. Without LibreOffice, the DOCX is rendered in memory and uploaded to
+    Google Drive directly, so nothing is written to output_docx_path.
+    """
     # Compute the PDF output path by replacing the .docx extension with .pdf.
     pdf_output_path = os.path.splitext(output_docx_path)[0] + ".pdf"
-    
-    # Convert the DOCX to PDF using the Google Drive conversion function.
-    pdf_output_path = convert_docx_to_pdf_gdrive(output_docx_path, pdf_output_path)
-    print(f"Converted to PDF: {pdf_output_path}")
+
+    if _libreoffice_binary() is None:
+        # Drive conversion reads from memory, so skip the DOCX write/read round trip
+        docx_buffer = io.BytesIO()
+        render_sweet_spot_docx(parsed_strengths, strength_data, person_name, template_path, docx_buffer)
+        pdf_output_path = convert_docx_to_pdf_gdrive(docx_buffer, pdf_output_path)
+        logger.debug("Converted to PDF: %s", pdf_output_path)
+        return pdf_output_path
+
+    render_sweet_spot_docx(parsed_strengths, strength_data, person_name, template_path, output_docx_path)
+
+    # Convert the DOCX to PDF locally with LibreOffice.
+    pdf_output_path = convert_docx_to_pdf_local(output_docx_path, pdf_output_path)
+    logger.debug("Converted to PDF: %s", pdf_output_path)
     return pdf_output_path
 
 
-import os
-import pandas as pd
-from docxtpl import DocxTemplate
-import subprocess
+# Question columns are read as categoricals: each holds only a handful of distinct answers
+CONFLICT_CSV_DTYPES = {col: "category" for col in QUESTION_CATEGORIES}
+
+
+def _read_conflict_csv(csv_path):
+    """Reads the conflict survey CSV, parsing only the name and question columns."""
+    return pd.read_csv(
+        csv_path,
+        usecols=lambda col: col == "First and Last Name" or col in QUESTION_CATEGORIES,
+        dtype=CONFLICT_CSV_DTYPES,
+        engine="c",
+    )
+
+
+def _score_answers(answers):
+    """Maps one column of answers through SCORE_MAP (after stripping); unknown answers score 0."""
+    if isinstance(answers.dtype, pd.CategoricalDtype):
+        # Score each distinct answer once, then look the scores up by category code
+        # (code -1 is a missing answer)
+        code_scores = {
+            code: SCORE_MAP.get(str(answer).strip(), 0)
+            for code, answer in enumerate(answers.cat.categories)
+        }
+        code_scores[-1] = 0
+        return answers.cat.codes.map(code_scores)
+    return answers.astype(str).str.strip().map(SCORE_MAP)
+
+
+def score_conflict_categories(df):
+    """
+    Scores every respondent at once: maps the answers in the QUESTION_CATEGORIES columns
+    through SCORE_MAP (unknown or missing answers count 0) and sums them per category.
+
+    Returns:
+      DataFrame: One integer column per category, indexed like df.
+    """
+    question_cols = [col for col in QUESTION_CATEGORIES if col in df.columns]
+    scored = df[question_cols].apply(_score_answers).fillna(0)
+    return pd.DataFrame({
+        category: scored[[col for col in question_cols if QUESTION_CATEGORIES[col] == category]]
+        .sum(axis=1)
+        .astype(int)
+        for category in dict.fromkeys(QUESTION_CATEGORIES.values())
+    }, index=df.index)
+
+
+def init_render_worker(template_path):
+    """ProcessPoolExecutor initializer: reads the DOCX template into the worker's cache once."""
+    load_docx_template(template_path)
+
+
+def render_docx_job(job):
+    """Renders one (template_path, context, output_path) job and returns output_path."""
+    template_path, context, output_path = job
+    doc = load_docx_template(template_path)
+    doc.render(context)
+    doc.save(output_path)
+    logger.debug("Saved DOCX: %s", output_path)
+    return output_path
+
 
-# Assuming SCORE_MAP and QUESTION_CATEGORIES are defined elsewhere in your module.
-# Also assuming convert_to_pdf_via_libreoffice is defined as follows:
 def fill_conflict_docs(csv_path, template_path, output_dir="."):
     """
     1) Reads survey responses from `csv_path`.
     2) Converts textual answers (Rarely, Sometimes, etc.) to numeric scores using SCORE_MAP.
     3) Sums scores by category (Collaborating, Avoiding, etc.) based on QUESTION_CATEGORIES.
-    4) Fills a Word template for each respondent and saves the .docx file.
-    5) Converts the saved DOCX to a PDF.
+    4) Fills a Word template for each respondent and saves the .docx file, rendering
+       across worker processes.
+    5) Converts the saved DOCX files to PDFs in one batch; on the Google Drive path each
+       file starts converting as soon as it is rendered.
     6) **Returns a list of participant names**.
 
     Expects a single column "First and Last Name" in the CSV.
     """
-    df = pd.read_csv(csv_path)
+    df = _read_conflict_csv(csv_path)
+    scores = score_conflict_categories(df)
     participant_names = []  # Store participant names
+    # Output DOCX path -> (template_path, context, output DOCX path). Rows repeating a name
+    # share an output path; the later row wins, as it did when each row overwrote the file.
+    jobs = {}
 
-    for idx, row in df.iterrows():
-        full_name = str(row["First and Last Name"]).strip()
+    # Plain column access per row; iterrows() would build a Series for every respondent
+    for raw_name, totals in zip(df["First and Last Name"], scores.itertuples(index=False)):
+        full_name = str(raw_name).strip()
         if full_name == "Heather  Griffin":
             full_name = "Heather Griffin"
         if pd.isna(full_name) or full_name == "":
@@ -397,94 +830,110 @@ def fill_conflict_docs(csv_path, template_path, output_dir="."):
 
         participant_names.append(full_name)  # Collect valid names
 
-        # Initialize category scores
-        category_scores = {category: 0 for category in QUESTION_CATEGORIES.values()}
-
-        for question_col, category in QUESTION_CATEGORIES.items():
-            if question_col in df.columns:
-                answer_text = str(row[question_col]).strip()
-                numeric_score = SCORE_MAP.get(answer_text, 0)
-                category_scores[category] += numeric_score
-
         # Build template context
         context = {
             "name": full_name,
-            "Col": category_scores["Collaborating"],
-            "Com": category_scores["Competing"],
-            "Avo": category_scores["Avoiding"],
-            "Acc": category_scores["Accommodating"],
-            "Co2": category_scores["Compromising"],
+            "Col": int(totals.Collaborating),
+            "Com": int(totals.Competing),
+            "Avo": int(totals.Avoiding),
+            "Acc": int(totals.Accommodating),
+            "Co2": int(totals.Compromising),
         }
 
-        # Save DOCX
         safe_name = full_name.replace(" ", "_")
         output_filename = f"{safe_name}_ConflictStyle3.docx"
         output_path = os.path.join(output_dir, output_filename)
-        doc = DocxTemplate(template_path)
-        doc.render(context)
-        doc.save(output_path)
-        print(f"Saved DOCX: {output_path}")
-
-        # Compute PDF output path by replacing .docx with .pdf
-        pdf_output_path = os.path.splitext(output_path)[0] + ".pdf"
-        pdf_output_path = convert_docx_to_pdf_gdrive(output_path, pdf_output_path)
-        print(f"Converted to PDF: {pdf_output_path}")
-
-        # Remove the intermediate DOCX after conversion
+        jobs[output_path] = (template_path, context, output_path)
+
+    if not jobs:
+        return participant_names
+
+    # Render the DOCX files in worker processes (docxtpl rendering is CPU-bound and holds
+    # the GIL). map() yields them in order as they finish, and the converter consumes that
+    # lazily, so on the Drive path conversion starts while later files are still rendering.
+    # jobs holds each output path once, so no two workers ever save the same DOCX. On Linux
+    # the pool forks the multi-threaded Streamlit server; workers only render and never touch
+    # Streamlit or the pooled Drive clients (those are reset after fork, see _borrow_http).
+    with ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, len(jobs)),
+        initializer=init_render_worker,
+        initargs=(template_path,)
+    ) as executor:
+        rendered = executor.map(render_docx_job, jobs.values())
+        # Convert every DOCX in one pass (PDF paths replace .docx with .pdf)
+        for pdf_output_path in convert_docx_batch_to_pdf(rendered):
+            logger.debug("Converted to PDF: %s", pdf_output_path)
+
+    # Remove the intermediate DOCX files after conversion (each distinct path once)
+    for output_path in jobs:
         os.remove(output_path)
 
     return participant_names  # Return the list of names
 
 
-def fill_conflict_docs_for_one(csv_path, template_path, output_dir, participant_name):
+def clean_name(s):
+    return " ".join(str(s).split())
+
+
+def load_conflict_responses(csv_path):
     """
-    Reads survey responses from `csv_path`, filters for a single participant, converts textual answers
-    to numeric scores using SCORE_MAP, sums scores by category based on QUESTION_CATEGORIES, and fills a
-    Word template for that participant. Saves the DOCX file to output_dir and then converts it to a PDF.
+    Reads the conflict survey CSV once so it can be shared across participants.
 
-    Expects a column "First and Last Name" in the CSV.
+    Only the "First and Last Name" column and the QUESTION_CATEGORIES columns are parsed,
+    the latter as categoricals. The result is indexed by the whitespace-normalized name (see clean_name)
+    and keeps only the first response per participant. The per-category totals from
+    score_conflict_categories are added as integer columns named after each category.
+
+    The parsed frame is cached per path and modification time, so repeated calls for the
+    same CSV (e.g. render_conflict_docx_for_one without `df`) don't re-parse it. Treat the
+    returned DataFrame as read-only.
     """
-    import os
-    import pandas as pd
-    from docxtpl import DocxTemplate
+    return _load_conflict_responses(csv_path, os.path.getmtime(csv_path))
 
-    # Read the CSV into a DataFrame
-    df = pd.read_csv(csv_path)
 
+@functools.lru_cache(maxsize=4)
+def _load_conflict_responses(csv_path, mtime):
+    df = _read_conflict_csv(csv_path)
+    df = df.dropna(subset=["First and Last Name"])
+    df.index = df["First and Last Name"].map(clean_name).rename(None)
+    df = df[~df.index.duplicated()]
+    # Score everyone up front so per-participant rendering is just a row lookup
+    return df.join(score_conflict_categories(df))
 
-    def clean(s):
-        return " ".join(str(s).split())
 
+def render_conflict_docx_for_one(csv_path, template_path, output_dir, participant_name, df=None):
+    """
+    Reads survey responses from `csv_path`, filters for a single participant, converts textual answers
+    to numeric scores using SCORE_MAP, sums scores by category based on QUESTION_CATEGORIES, and fills a
+    Word template for that participant. Saves the DOCX file to output_dir without converting it.
 
-    filtered_df = df[df["First and Last Name"].map(clean) == clean(participant_name)]
+    Callers handling many participants should load the CSV once with load_conflict_responses
+    and pass it as `df`, which skips re-reading `csv_path`. `df` must come from
+    load_conflict_responses, which also provides the category totals.
 
-    # Filter for the specified participant
+    Expects a column "First and Last Name" in the CSV.
 
-    if filtered_df.empty:
-        print(f"No responses found for {participant_name} in {csv_path}")
+    Returns:
+      str: The path to the saved DOCX, or None if the participant has no responses.
+    """
+    if df is None:
+        df = load_conflict_responses(csv_path)
+
+    # Look up the specified participant
+    key = clean_name(participant_name)
+    if key not in df.index:
+        logger.warning("No responses found for %s in %s", participant_name, csv_path)
         return
 
-    # Process only the first matching row
-    row = filtered_df.iloc[0]
+    row = df.loc[key]
     full_name = str(row["First and Last Name"]).strip()
 
-    # Initialize category scores
-    category_scores = {
-        "Collaborating": 0,
-        "Compromising": 0,
-        "Avoiding": 0,
-        "Accommodating": 0,
-        "Competing": 0
-    }
+    for question_col in QUESTION_CATEGORIES:
+        if question_col not in df.columns:
+            logger.warning("'%s' not found in CSV columns.", question_col)
 
-    # For each question column mapped in QUESTION_CATEGORIES, convert response to a number and sum by category.
-    for question_col, category in QUESTION_CATEGORIES.items():
-        if question_col in df.columns:
-            answer_text = str(row[question_col]).strip()
-            numeric_score = SCORE_MAP.get(answer_text, 0)
-            category_scores[category] += numeric_score
-        else:
-            print(f"Warning: '{question_col}' not found in CSV columns.")
+    # Category totals were computed for every participant by load_conflict_responses
+    category_scores = {category: int(row[category]) for category in dict.fromkeys(QUESTION_CATEGORIES.values())}
 
     # Build context for the DOCX template
     context = {
@@ -497,7 +946,7 @@ def fill_conflict_docs_for_one(csv_path, template_path, output_dir, participant_
     }
 
     # Load the Word template and render the context
-    doc = DocxTemplate(template_path)
+    doc = load_docx_template(template_path)
     doc.render(context)
 
     safe_name = full_name.replace(" ", "_")
@@ -506,14 +955,28 @@ def fill_conflict_docs_for_one(csv_path, template_path, output_dir, participant_
 
     # Save the filled DOCX
     doc.save(output_path)
-    print(f"Saved DOCX: {output_path}")
+    logger.debug("Saved DOCX: %s", output_path)
+    return output_path
+
+
+def fill_conflict_docs_for_one(csv_path, template_path, output_dir, participant_name, df=None):
+    """
+    Fills the conflict style template for a single participant (see render_conflict_docx_for_one)
+    and converts the DOCX to a PDF.
+
+    Returns:
+      str: The path to the PDF, or None if the participant has no responses.
+    """
+    output_path = render_conflict_docx_for_one(csv_path, template_path, output_dir, participant_name, df=df)
+    if not output_path:
+        return
 
     # Compute the PDF output path by replacing the .docx extension with .pdf
     pdf_output_path = os.path.splitext(output_path)[0] + ".pdf"
 
     # Convert the DOCX to PDF using your helper function
-    pdf_output_path = convert_docx_to_pdf_gdrive(output_path, pdf_output_path)
-    print(f"Converted to PDF: {pdf_output_path}")
+    pdf_output_path = convert_docx_to_pdf(output_path, pdf_output_path)
+    logger.debug("Converted to PDF: %s", pdf_output_path)
 
     # Optionally, delete the intermediate DOCX:
     os.remove(output_path)
@@ -522,142 +985,91 @@ def fill_conflict_docs_for_one(csv_path, template_path, output_dir, participant_
 
 
 
-from pypdf import PdfReader, PdfWriter
-
-def merge_custom_pages_by_index(
+def build_workbook_pdf(
     template_pdf,
     cover_pdf,
     via_pdf,
     sweet_pdf,
     conflict_pdf,
-    output_pdf
+    output_pdf,
+    start_page_index=3,
+    start_page_number=3,
+    margin=36
 ):
     """
+    Assembles and paginates a workbook in a single PyMuPDF pass.
+
     Replaces specific pages (by index) in the template PDF with entire custom PDFs.
     - Page 0 -> cover_pdf
     - Page 4 -> via_pdf
     - Page 8 -> sweet_pdf
     - Page 11 -> conflict_pdf
     - All other pages remain as-is.
-    """
-
-    writer = PdfWriter()
-
-    # Read all PDFs
-    template_reader = PdfReader(template_pdf)
-    cover_reader    = PdfReader(cover_pdf)
-    via_reader      = PdfReader(via_pdf)
-    sweet_reader    = PdfReader(sweet_pdf)
-    conflict_reader = PdfReader(conflict_pdf) if conflict_pdf else None
-
-
-    # Loop through every page in the template
-    for i in range(len(template_reader.pages)):
-        if i == 0:
-            # Insert all pages from cover_pdf
-            for cp in cover_reader.pages:
-                writer.add_page(cp)
-        elif i == 4:
-            # Insert all pages from via_pdf
-            for vp in via_reader.pages:
-                writer.add_page(vp)
-        elif i == 8:
-            # Insert all pages from sweet_pdf
-            for sp in sweet_reader.pages:
-                writer.add_page(sp)
-        elif i == 11:
-            if conflict_reader:
-                for cr in conflict_reader.pages:
-                    writer.add_page(cr)
-        else:
-            writer.add_page(template_reader.pages[i])  # keep template page
-
-    # Write out the merged PDF
-    with open(output_pdf, "wb") as out:
-        writer.write(out)
-
-    print(f"Merged PDF created: {output_pdf}")
-from pypdf import PdfReader, PdfWriter
-from io import BytesIO
-from reportlab.pdfgen import canvas
-
-from reportlab.pdfgen import canvas
-from reportlab.lib.colors import black, white
-from io import BytesIO
-from pypdf import PdfReader
-
-from reportlab.pdfgen import canvas
-from reportlab.lib.colors import black, white
-from io import BytesIO
-from pypdf import PdfReader
-
-def create_page_number_overlay(page_width, page_height, page_number, margin=36, text_color="black"):
-    """
-    Creates a PDF overlay with the page number in Times New Roman 10 pt 
-    at the lower right corner with a given margin (36 pts ~ 0.5 inch).
-    
-    The text color can be specified with the text_color parameter.
-    """
-    packet = BytesIO()
-    c = canvas.Canvas(packet, pagesize=(page_width, page_height))
-    c.setFont("Times-Roman", 10)
-
-    # Set fill color based on text_color
-    if text_color.lower() == "white":
-        c.setFillColor(white)
-    else:
-        c.setFillColor(black)
-
-    text = str(page_number)
-    text_width = c.stringWidth(text, "Times-Roman", 10)
-    x = page_width - margin - text_width
-    y = margin
-    c.drawString(x, y, text)
-    c.save()
-    packet.seek(0)
 
-    overlay_reader = PdfReader(packet)
-    return overlay_reader.pages[0]
-
-
-def paginate_pdf(input_pdf, output_pdf, start_page_index=3, start_page_number=3):
-    """
-    Adds page numbers to the PDF starting at the given page index.
-    
+    Page numbers are then drawn in Times-Roman 10 pt at the lower right corner, `margin`
+    points (36 pts ~ 0.5 inch) from the edges:
     - Pages with index less than start_page_index are left unnumbered.
-    - The first numbered page (index start_page_index) is assigned the page number start_page_number.
-    - The number is placed in the lower right footer in Times New Roman 10 pt.
+    - The first numbered page (index start_page_index) is assigned start_page_number.
     - If a page is horizontal (landscape), the page number is written in white text.
+    Both the orientation and the position use the page's unrotated mediabox.
+
+    The document is kept in memory and written once, to output_pdf. template_pdf may be a
+    path or an already-open fitz.Document, so callers building many workbooks from the
+    same template only parse it once. A path's bytes are cached, so it is read from disk once.
     """
-    reader = PdfReader(input_pdf)
-    writer = PdfWriter()
-    num_pages = len(reader.pages)
-
-    for i in range(num_pages):
-        page = reader.pages[i]
-        if i >= start_page_index:
-            # Compute page number
-            page_number = start_page_number + (i - start_page_index)
-            # Get page dimensions from the media box
-            page_width = float(page.mediabox.upper_right[0])
-            page_height = float(page.mediabox.upper_right[1])
-            # Determine text color: white for landscape, black for portrait
-            text_color = "white" if page_width > page_height else "black"
-            # Pass text_color as a keyword argument so margin stays at its default value
-            overlay = create_page_number_overlay(page_width, page_height, page_number, text_color=text_color)
-            page.merge_page(overlay)
-        writer.add_page(page)
-
-    with open(output_pdf, "wb") as f:
-        writer.write(f)
-    print(f"Paginated PDF saved as: {output_pdf}")
+    if isinstance(template_pdf, fitz.Document):
+        template_doc = template_pdf
+    else:
+        # The file is read once per path/mtime and re-opened from memory after that
+        template_bytes = _read_template_bytes(template_pdf, os.path.getmtime(template_pdf))
+        template_doc = fitz.open(stream=template_bytes, filetype="pdf")
+
+    replacements = {0: cover_pdf, 4: via_pdf, 8: sweet_pdf, 11: conflict_pdf}
+    doc = fitz.open()
+
+    # Copy each run of kept template pages with one insert_pdf call, so resources shared
+    # by those pages (fonts, images) are copied once per run instead of once per page
+    run_start = 0
+    for i in sorted(replacements) + [len(template_doc)]:
+        if i > run_start:
+            doc.insert_pdf(template_doc, from_page=run_start, to_page=min(i, len(template_doc)) - 1)
+        if i >= len(template_doc):
+            break
+        # Insert all pages from the custom PDF (the conflict PDF may be missing)
+        if replacements[i]:
+            with fitz.open(replacements[i]) as part:
+                doc.insert_pdf(part)
+        run_start = i + 1
+
+    if template_doc is not template_pdf:
+        template_doc.close()
+
+    # fitz.get_text_length builds a new Font on every call; measure with one instance instead
+    number_font = fitz.Font("tiro")
+    for i in range(start_page_index, len(doc)):
+        page = doc[i]
+        text = str(start_page_number + (i - start_page_index))
+        # Use the unrotated mediabox, like the original overlay did: page.rect reflects
+        # /Rotate, but insert_text positions text on the unrotated page
+        page_width, page_height = page.mediabox.width, page.mediabox.height
+        # White for landscape, black for portrait
+        color = (1, 1, 1) if page_width > page_height else (0, 0, 0)
+        # "tiro" is PyMuPDF's name for the built-in Times-Roman font; y grows downwards
+        text_width = number_font.text_length(text, fontsize=10)
+        page.insert_text(
+            (page_width - margin - text_width, page_height - margin),
+            text,
+            fontname="tiro",
+            fontsize=10,
+            color=color
+        )
+
+    doc.save(output_pdf, garbage=4, deflate=True)
+    doc.close()
+    logger.debug("Workbook PDF saved as: %s", output_pdf)
 
 
-import os
-from docxtpl import DocxTemplate
-import subprocess
-
-def generate_cover_pdf(
+def render_cover_docx(
     participant_name: str,
     date: str,
     cohort: str,
@@ -665,7 +1077,7 @@ def generate_cover_pdf(
     lab_type: str = "Connection Lab",
 ):
     """
-    Generates a customized cover page PDF using a DOCX cover template.
+    Fills the DOCX cover template for a participant and saves it, without converting it.
 
     If lab_type == "Leadership Lab", uses NAISTemplate.docx.
     Otherwise uses coverTemplate.docx.
@@ -678,7 +1090,7 @@ def generate_cover_pdf(
       lab_type (str): "Connection Lab" or "Leadership Lab"
 
     Returns:
-      str: The path to the generated cover PDF.
+      str: The path to the filled cover DOCX.
     """
 
     # Choose which cover template to use
@@ -701,25 +1113,61 @@ def generate_cover_pdf(
     }
 
     # Render the DOCX template with the context and save it
-    doc = DocxTemplate(cover_template_path)
+    doc = load_docx_template(cover_template_path)
     doc.render(context)
     doc.save(output_docx_path)
-    print(f"Cover DOCX saved as: {output_docx_path}")
+    logger.debug("Cover DOCX saved as: %s", output_docx_path)
+    return output_docx_path
+
+
+def generate_cover_pdf(
+    participant_name: str,
+    date: str,
+    cohort: str,
+    output_folder: str = ".",
+    lab_type: str = "Connection Lab",
+):
+    """
+    Generates a customized cover page PDF using a DOCX cover template (see render_cover_docx).
+
+    Returns:
+      str: The path to the generated cover PDF.
+    """
+    output_docx_path = render_cover_docx(participant_name, date, cohort, output_folder, lab_type=lab_type)
 
     # Create a proper PDF filename from the DOCX filename
     pdf_filename = os.path.splitext(os.path.basename(output_docx_path))[0] + ".pdf"
     output_pdf_path = os.path.join(output_folder, pdf_filename)
 
     # Convert the DOCX to PDF using your conversion function
-    cover_pdf = convert_docx_to_pdf_gdrive(output_docx_path, output_pdf_path)
-    print(f"Cover PDF saved as: {cover_pdf}")
+    cover_pdf = convert_docx_to_pdf(output_docx_path, output_pdf_path)
+    logger.debug("Cover PDF saved as: %s", cover_pdf)
 
     # Remove the intermediate DOCX file
     os.remove(output_docx_path)
-    print(f"Intermediate DOCX file {output_docx_path} deleted.")
+    logger.debug("Intermediate DOCX file %s deleted.", output_docx_path)
 
     return cover_pdf
 
+def render_via_survey(pdf_path, strength_data, template_path, output_folder):
+    """
+    Parses a VIA survey PDF and fills the Sweet Spot template for it, without converting the
+    DOCX. Callers handling several surveys can collect the DOCX paths and convert them together
+    with convert_docx_batch_to_pdf.
+
+    Returns:
+      str: The path to the filled Sweet Spot DOCX.
+    """
+    # Parse the VIA PDF to get the participant's name and strengths.
+    person_name, parsed_strengths = parse_via_pdf(pdf_path)
+
+    # Use the participant's name (cleaned) to build an output DOCX path.
+    safe_name = person_name.replace(" ", "_")
+    output_docx_path = os.path.join(output_folder, f"{safe_name}_SweetSpot.docx")
+
+    return render_sweet_spot_docx(parsed_strengths, strength_data, person_name, template_path, output_docx_path)
+
+
 def process_via_survey(pdf_path, strength_data, template_path, output_folder):
     """
     Processes the VIA survey PDF by:
@@ -749,3 +1197,86 @@ def process_via_survey(pdf_path, strength_data, template_path, output_folder):
 
     return sweet_spot_pdf
 
+
+def workbook_paths(participant_name, output_folder, work_dir=None):
+    """
+    Returns the output paths for one participant's workbook, all derived from a single
+    filename stem (the name with spaces replaced by underscores).
+
+    Intermediate files go in work_dir (defaults to output_folder); the final workbook
+    always goes in output_folder.
+    """
+    stem = participant_name.replace(" ", "_")
+    work_dir = work_dir or output_folder
+    return {
+        "sweet": f"{work_dir}/{stem}_SweetSpot.docx",
+        "final": f"{output_folder}/{stem}_workbook.pdf",
+    }
+
+
+_BATCH_STATE = {}
+
+def init_batch_worker(conflict_df, template_pdf):
+    """
+    ProcessPoolExecutor initializer for Batch mode: hands each worker process the
+    conflict responses and opens the workbook template once, instead of redoing
+    both for every job.
+    """
+    _BATCH_STATE["conflict_df"] = conflict_df
+    _BATCH_STATE["template_doc"] = fitz.open(template_pdf)
+
+
+def process_one(args):
+    """
+    Builds the finished workbook for one matched Batch-mode participant.
+
+    This runs inside a worker process, so it is kept at module level and only takes
+    picklable arguments. Workers started with init_batch_worker reuse the pre-loaded
+    conflict responses and template; otherwise they are read from conflict_csv_path
+    and template_pdf.
+
+    Parameters:
+      args (tuple): (csv_name, via_pdf, via_results, conflict_csv_path, term, cohort, lab_type,
+                     template_pdf, sweet_template_docx, conflict_template_docx, work_dir,
+                     output_folder)
+                    Intermediate files are written to work_dir, the workbook to output_folder.
+
+    Returns:
+      tuple: (csv_name, final workbook path or None, error message or None).
+             A missing workbook without an error means no conflict responses were found.
+    """
+    (csv_name, via_pdf, via_results, conflict_csv_path, term, cohort, lab_type,
+     template_pdf, sweet_template_docx, conflict_template_docx, work_dir, output_folder) = args
+
+    paths = workbook_paths(csv_name, output_folder, work_dir)
+
+    try:
+        # Fill every DOCX first so they can all be converted in one go
+        conflict_docx = render_conflict_docx_for_one(
+            conflict_csv_path, conflict_template_docx, work_dir, csv_name,
+            df=_BATCH_STATE.get("conflict_df")
+        )
+        if not conflict_docx:
+            return csv_name, None, None
+
+        cover_docx = render_cover_docx(csv_name, term, cohort, work_dir, lab_type=lab_type)
+        # Fill Sweet Spot Template from the already-parsed VIA results
+        sweet_docx = render_sweet_spot_docx(via_results, STRENGTH_DATA, csv_name, sweet_template_docx, paths["sweet"])
+
+        cover_pdf, sweet_pdf, conflict_pdf = convert_docx_batch_to_pdf([cover_docx, sweet_docx, conflict_docx])
+
+        # Merge and paginate the PDFs
+        build_workbook_pdf(
+            template_pdf=_BATCH_STATE.get("template_doc", template_pdf),
+            cover_pdf=cover_pdf,
+            via_pdf=via_pdf,
+            sweet_pdf=sweet_pdf,
+            conflict_pdf=conflict_pdf,
+            output_pdf=paths["final"],
+            start_page_index=3,
+            start_page_number=3
+        )
+    except Exception as e:
+        return csv_name, None, str(e)
+
+    return csv_name, paths["final"], None
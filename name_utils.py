@@ -0,0 +1,66 @@
+import re
+
+_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+_SUFFIX_RE = re.compile(r"\s*,?\s*\b(?:jr|sr|ii|iii|iv|v)\.?\s*$", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+def normalize_spaces(s: str) -> str:
+    return _WS_RE.sub(" ", s).strip()
+
+def normalize_key(name) -> frozenset:
+    """
+    Reduce a name to an order-insensitive set of lowercase tokens, with punctuation
+    and suffixes (Jr., Sr., II, III, ...) dropped, so equivalent names hash the same.
+    """
+    tokens = _PUNCT_RE.sub(" ", str(name).lower()).split()
+    return frozenset(token for token in tokens if token not in _SUFFIXES)
+
+def split_first_last(person_name: str):
+    """
+    Split a full name into (first_name, last_name) for spreadsheet export.
+
+    Heuristics:
+    - Handles 'Last, First Middle' -> ('First', 'Last')
+    - Handles suffixes (e.g., Jr., Sr., II, III) by dropping them from the tail
+    - If no last name present, last_name = '' (keeps it safe for spreadsheets)
+    """
+    if not person_name:
+        return "", ""
+
+    name = normalize_spaces(person_name)
+
+    # Remove 'VIA' artifacts just in case (defensive; parse_via_pdf already strips)
+    name = name.replace("VIA Character Strengths Profile", "").strip()
+
+    # Drop a trailing suffix, including "Smith, John, Jr." style
+    name = _SUFFIX_RE.sub("", name)
+
+    if "," in name:
+        # Format: "Last, First Middle ..." (the last name may carry its own suffix)
+        last, first_part = [normalize_spaces(x) for x in name.split(",", 1)]
+        first_tokens = _SUFFIX_RE.sub("", first_part).split()
+        first = first_tokens[0] if first_tokens else ""
+        last = _SUFFIX_RE.sub("", last)
+        return first, last
+
+    # Format: "First Middle Last [Suffix]"
+    tokens = name.split()
+
+    if not tokens:
+        return "", ""
+    if len(tokens) == 1:
+        return tokens[0], ""
+    else:
+        # First token is first name, everything after the first token collapsed into last name
+        first = tokens[0]
+        last = " ".join(tokens[1:])
+        return first, last
+
+def strengths_to_row(results, top_n=24):
+    """Convert parse_via_pdf results -> list of strength names ordered by rank, clipped/padded to top_n."""
+    strengths = [s for (_, s) in sorted(results, key=lambda x: x[0])]
+    strengths = strengths[:top_n]
+    if len(strengths) < top_n:
+        strengths += [""] * (top_n - len(strengths))
+    return strengths